@@ -1,51 +1,492 @@
 import streamlit as st
 import pandas as pd
-import yfinance as yf
-import plotly.express as px
-import plotly.graph_objects as go
 import datetime
+import time
 import numpy as np
 
+# yfinance and plotly are imported lazily inside the functions that use them;
+# sys.modules makes every import after the first an O(1) lookup
+
+# numba is optional: with it the RSI kernel is JIT-compiled, without it the
+# vectorized pandas path below is used
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _rsi_njit(close, window):
+        # Wilder's running averages, matching ewm(alpha=1/window, adjust=False)
+        n = close.size
+        rsi = np.empty(n)
+        alpha = 1.0 / window
+        avg_gain = 0.0
+        avg_loss = 0.0
+        rsi[0] = np.nan
+        for i in range(1, n):
+            delta = close[i] - close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain += alpha * (gain - avg_gain)
+            avg_loss += alpha * (loss - avg_loss)
+            if avg_loss == 0.0:
+                rsi[i] = np.nan
+            else:
+                rsi[i] = 100 - 100 / (1 + avg_gain / avg_loss)
+        return rsi
+
+    # Warm the JIT at import on a dummy series so the first user-visible RSI call
+    # pays a cache load, not a compile
+    _rsi_njit(np.zeros(2), 14)
+
 # Define available stocks for simplicity
 available_stocks = ['AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA', 'META', 'NFLX', 'NVDA']
 
 # Initial virtual balance
 initial_balance = 1000
 
-# Initialize session state variables
+# Column dtypes applied when the transaction history is materialized, so the frame
+# gets compact typed columns instead of inferred object columns
+history_schema = {
+    'Date': 'datetime64[ns]',
+    'Stock': 'string',
+    'Type': 'category',
+    'Quantity': 'int32',
+    'Price': 'float32',
+    'Total': 'float32',
+}
+
+# The performance log lives in a pre-allocated structured array grown geometrically,
+# so rendering it is a zero-copy wrap instead of a per-dict conversion
+performance_dtype = np.dtype([('Date', 'datetime64[ns]'), ('Total Value', 'f8')])
+
+# Session-state keys written through to the disk cache so they survive restarts
+persisted_keys = ('portfolio', 'cash_balance', 'total_value', 'transaction_history', 'performance', 'watchlist')
+
+@st.cache_resource(show_spinner=False)
+def get_disk_cache():
+    import diskcache
+    return diskcache.Cache('.cache_trade')
+
+def performance_view():
+    # The filled slots of the performance array, as a zero-copy slice
+    return st.session_state.performance[:st.session_state.performance_count]
+
+def append_performance(date, total_value):
+    arr = st.session_state.performance
+    count = st.session_state.performance_count
+    if count == arr.size:
+        arr = np.resize(arr, max(2 * arr.size, 64))
+        st.session_state.performance = arr
+    arr[count] = (np.datetime64(date), total_value)
+    st.session_state.performance_count = count + 1
+
+def persist_session_state():
+    disk = get_disk_cache()
+    for key in persisted_keys:
+        value = st.session_state[key]
+        if key == 'performance':
+            value = performance_view().copy()
+        disk[key] = value
+
+# Initialize session state variables, restoring any persisted values from disk
 def initialize_session_state():
+    disk = get_disk_cache()
     if 'portfolio' not in st.session_state:
-        st.session_state.portfolio = {stock: 0 for stock in available_stocks}
+        # keyed by stock symbol -> {'Quantity': int, 'Total_Invested': float}
+        st.session_state.portfolio = disk.get('portfolio', {})
     if 'cash_balance' not in st.session_state:
-        st.session_state.cash_balance = initial_balance
+        st.session_state.cash_balance = disk.get('cash_balance', initial_balance)
+    if 'total_value' not in st.session_state:
+        # cash + holdings at last known prices; a trade at the current price leaves it unchanged
+        st.session_state.total_value = disk.get('total_value', initial_balance)
     if 'transaction_history' not in st.session_state:
-        st.session_state.transaction_history = []
+        # Columnar: one list per field, so the display frame builds from typed columns
+        # instead of converting one dict per row
+        st.session_state.transaction_history = disk.get('transaction_history', {column: [] for column in history_schema})
     if 'performance' not in st.session_state:
-        st.session_state.performance = []
+        st.session_state.performance = disk.get('performance', np.empty(0, dtype=performance_dtype))
+        st.session_state.performance_count = st.session_state.performance.size
     if 'watchlist' not in st.session_state:
-        st.session_state.watchlist = []
-
+        st.session_state.watchlist = disk.get('watchlist', [])
+
+def _retry(fn, *args, tries=3, base=0.5, **kwargs):
+    # Yahoo rate limits surface as exceptions or silently empty frames; back off
+    # exponentially instead of handing a zero price downstream
+    for attempt in range(tries):
+        try:
+            result = fn(*args, **kwargs)
+            if not (hasattr(result, 'empty') and result.empty):
+                return result
+        except Exception:
+            pass
+        time.sleep(base * 2 ** attempt)
+    return fn(*args, **kwargs)
+
+@st.cache_resource(show_spinner=False)
+def get_http_session():
+    # One shared HTTP-cached session: pooled connections, repeat requests served from SQLite.
+    # Chart/history responses are exempt so fetch_stock_price.clear(ticker) really refetches
+    # instead of being answered from the HTTP cache; st.cache_data TTLs own staleness there.
+    from requests_cache import CachedSession, DO_NOT_CACHE
+    return CachedSession('.yf_http_cache', expire_after=60,
+                         urls_expire_after={'*/v8/finance/chart/*': DO_NOT_CACHE})
+
+@st.cache_resource(show_spinner=False)
+def get_ticker(symbol):
+    import yfinance as yf
+    return yf.Ticker(symbol, session=get_http_session())
+
+@st.cache_data(ttl=60, show_spinner=False)
 def fetch_stock_price(ticker):
-    stock = yf.Ticker(ticker)
-    return stock.history(period="1d")['Close'].iloc[0]
-
+    return _retry(get_ticker(ticker).history, period="1d")['Close'].iloc[0]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_stock_prices_batch(tickers):
+    import yfinance as yf
+    # One yf.download round-trip for all tickers; tuple argument keeps the cache key hashable
+    if not tickers:
+        return {}
+    # Two days of data so the last close is still there before today's bar fills in
+    data = _retry(yf.download, list(tickers), period='2d', group_by='ticker', threads=True, progress=False)
+    # yf.download flattens the column level away for a single ticker
+    if isinstance(data.columns, pd.MultiIndex):
+        closes = {ticker: data[ticker]['Close'] for ticker in tickers}
+    else:
+        closes = {tickers[0]: data['Close']}
+    # An all-NaN column (delisted or rate-limited ticker) is simply omitted;
+    # callers fall back via .get/.fillna rather than caching an exception here
+    prices = {}
+    for ticker in tickers:
+        close = closes[ticker].dropna()
+        if not close.empty:
+            prices[ticker] = float(close.iloc[-1])
+    return prices
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def fetch_stock_details(ticker):
-    stock = yf.Ticker(ticker)
-    info = stock.info
+    info = _retry(lambda: get_ticker(ticker).info)
     return info
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_risk_metrics(tickers):
+    import yfinance as yf
+    # One batched download for all tickers plus the market index, then one vectorized pass
+    data = _retry(yf.download, list(tickers) + ['^GSPC'], period='1y',
+                  group_by='column', auto_adjust=True, threads=True, progress=False)['Close']
+    returns = data.pct_change().dropna()
+    stds = returns[list(tickers)].std()
+    # One covariance matrix gives every beta at once instead of a per-ticker np.cov call
+    cov = returns.cov()
+    betas = (cov['^GSPC'] / cov.loc['^GSPC', '^GSPC']).drop('^GSPC')
+    risk_metrics_df = pd.DataFrame({'Standard Deviation': stds, 'Beta': betas})
+    return risk_metrics_df, returns['^GSPC']
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def fetch_stock_history(ticker, period='1mo'):
-    stock = yf.Ticker(ticker)
-    history = stock.history(period=period)
+    history = _retry(get_ticker(ticker).history, period=period)
     return history
 
-def calculate_rsi(data, window=14):
-    delta = data.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_sidebar_panel(ticker):
+    # Info, 6-month history, and RSI cached together so typing elsewhere in the app
+    # does not re-trigger the sidebar fetches
+    info = fetch_stock_details(ticker)
+    history = fetch_stock_history(ticker, period='6mo')
+    history['RSI'] = calculate_rsi(history['Close'])
+    return info, history
+
+# Figure builders cached on a cheap data fingerprint (length + last timestamp) so
+# reruns reuse the built Plotly object instead of re-serializing it; the underscore
+# argument tells Streamlit not to hash the frame itself
+@st.cache_resource(show_spinner=False)
+def build_sidebar_fig(ticker, fingerprint, _history):
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=_history.index, y=_history['Close'], mode='lines', name='Close Price'))
+    fig.add_trace(go.Scatter(x=_history.index, y=_history['RSI'], mode='lines', name='RSI'))
+    fig.update_layout(title=f'{ticker} Price and RSI', xaxis_title='Date', yaxis_title='Price/RSI')
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def build_candlestick_fig(ticker, fingerprint, _history):
+    import plotly.graph_objects as go
+    fig = go.Figure(data=[go.Candlestick(x=_history.index,
+                                         open=_history['Open'],
+                                         high=_history['High'],
+                                         low=_history['Low'],
+                                         close=_history['Close'])])
+    fig.update_layout(title=f'Candlestick Chart for {ticker}', xaxis_title='Date', yaxis_title='Price')
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def build_performance_fig(fingerprint, _performance):
+    import plotly.express as px
+    performance_df = pd.DataFrame(_performance)
+    return px.line(performance_df, x='Date', y='Total Value', title='Portfolio Performance Over Time')
+
+def rebuild_portfolio_df():
+    # Rebuilt only on trade events and price refreshes; plain reruns render the stored frame
+    if st.session_state.portfolio:
+        portfolio_df = pd.DataFrame(
+            [{'Stock': stock, 'Shares': holding['Quantity'], 'Total Invested': holding['Total_Invested']}
+             for stock, holding in st.session_state.portfolio.items()]
+        )
+        prices = fetch_stock_prices_batch(tuple(portfolio_df['Stock']))
+        portfolio_df['Current Price'] = portfolio_df['Stock'].map(prices).fillna(0.0)
+        # numpy arrays on the RHS skip pandas alignment overhead
+        portfolio_df['Total Value'] = portfolio_df['Shares'].to_numpy() * portfolio_df['Current Price'].to_numpy()
+    else:
+        portfolio_df = pd.DataFrame(columns=['Stock', 'Shares', 'Total Invested', 'Current Price', 'Total Value'])
+    st.session_state.portfolio_df = portfolio_df
+    return portfolio_df
+
+def to_weekly(history):
+    # Downsample daily OHLC to weekly bars: ~5x fewer candles to serialize and draw
+    return history.resample('W').agg({'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last'}).dropna()
+
+def portfolio_value(prices):
+    # Account value from a pre-fetched prices dict: no I/O on the hot trade/render path
+    quantities = np.array([holding['Quantity'] for holding in st.session_state.portfolio.values()], dtype=np.float64)
+    price_arr = np.array([prices.get(stock, 0.0) for stock in st.session_state.portfolio], dtype=np.float64)
+    holding_values = quantities * price_arr
+    return float(holding_values.sum()) + st.session_state.cash_balance, holding_values
+
+def calculate_rsi(close, window=14):
+    # Wilder's RSI via exponential smoothing instead of two rolling means
+    arr = np.asarray(close, dtype=np.float64)
+    if njit is not None and arr.size:
+        return _rsi_njit(arr, window)
+    delta = np.diff(arr, prepend=arr[0])
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    alpha = 1.0 / window
+    avg_gain = pd.Series(gain).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    avg_loss = pd.Series(loss).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    rs = avg_gain / np.where(avg_loss == 0, np.nan, avg_loss)
+    return 100 - 100 / (1 + rs)
+
+# Each tab body is a fragment so interacting with one tab reruns only that tab,
+# not every chart and yfinance fetch in the app.
+@st.fragment
+def render_portfolio():
+    import plotly.graph_objects as go
+    st.subheader('Your Virtual Portfolio')
+    st.write(f'Cash balance: ${st.session_state.cash_balance:.2f}')
+    portfolio_df = st.session_state.get('portfolio_df')
+    if portfolio_df is None:
+        portfolio_df = rebuild_portfolio_df()
+    if not portfolio_df.empty:
+        st.dataframe(portfolio_df, use_container_width=True, hide_index=True)
+
+        # Pie chart of portfolio distribution; the figure is built once and only its
+        # traces are updated, so reruns ship a minimal payload to the browser
+        pie_fig = st.session_state.get('pie_fig')
+        if pie_fig is None:
+            pie_fig = go.Figure(data=[go.Pie(labels=portfolio_df['Stock'], values=portfolio_df['Total Value'])])
+            pie_fig.update_layout(title='Portfolio Distribution')
+            st.session_state.pie_fig = pie_fig
+        else:
+            pie_fig.data[0].labels = portfolio_df['Stock']
+            pie_fig.data[0].values = portfolio_df['Total Value']
+        st.plotly_chart(pie_fig)
+    else:
+        st.write('You do not hold any stocks yet.')
+
+@st.fragment
+def render_transaction_history():
+    import plotly.express as px
+    st.subheader('Transaction History')
+    if st.session_state.transaction_history['Date']:
+        history_df = pd.DataFrame(st.session_state.transaction_history).astype(history_schema)
+        # Virtualized Arrow grid: constant-time render however long the history grows
+        st.dataframe(history_df, use_container_width=True, hide_index=True)
+
+        # Plot transaction history
+        fig = px.line(history_df, x='Date', y='Total', color='Type', title='Transaction History Over Time')
+        st.plotly_chart(fig)
+
+@st.fragment
+def render_performance():
+    import plotly.graph_objects as go
+    st.subheader('Portfolio Performance')
+    if st.session_state.performance_count:
+        performance = performance_view()
+        fig = build_performance_fig((performance.size, performance['Date'][-1]), performance)
+        st.plotly_chart(fig)
+
+    # Advanced Portfolio Analytics
+    st.subheader('Portfolio Analytics')
+    if st.button('Refresh Prices'):
+        fetch_stock_prices_batch.clear()
+        rebuild_portfolio_df()
+    prices = fetch_stock_prices_batch(tuple(st.session_state.portfolio))
+    total_value, holding_values = portfolio_value(prices)
+    st.session_state.total_value = total_value
+    st.write(f'Total portfolio value: ${total_value:.2f}')
+
+    # Same persistent-figure treatment as the portfolio pie
+    bar_fig = st.session_state.get('diversification_fig')
+    if bar_fig is None:
+        bar_fig = go.Figure(data=[go.Bar(x=list(st.session_state.portfolio), y=holding_values / total_value)])
+        bar_fig.update_layout(title='Portfolio Diversification', xaxis_title='Stock', yaxis_title='Proportion')
+        st.session_state.diversification_fig = bar_fig
+    else:
+        bar_fig.data[0].x = list(st.session_state.portfolio)
+        bar_fig.data[0].y = holding_values / total_value
+    st.plotly_chart(bar_fig)
+
+@st.fragment
+def render_trade():
+    st.subheader('Trade Stocks')
+    # Display available stocks
+    selected_stock = st.selectbox('Select a stock:', available_stocks)
+
+    # Get real-time price of the selected stock
+    current_price = fetch_stock_price(selected_stock)
+    st.write(f'Current price of {selected_stock}: ${current_price:.2f}')
+
+    # Get user input for quantity of stocks to buy/sell
+    quantity = st.number_input('Enter quantity:', min_value=1, step=1)
+
+    # Buttons for buying and selling
+    buy_button = st.button('Buy')
+    sell_button = st.button('Sell')
+
+    # Simulate buying/selling stocks
+    if buy_button or sell_button:
+        transaction_type = 'Buy' if buy_button else 'Sell'
+        cost = quantity * current_price
+
+        holding = st.session_state.portfolio.get(selected_stock)
+        if buy_button and st.session_state.cash_balance >= cost:
+            if holding is None:
+                holding = st.session_state.portfolio.setdefault(selected_stock, {'Quantity': 0, 'Total_Invested': 0.0})
+            holding['Quantity'] += quantity
+            holding['Total_Invested'] += cost
+            st.session_state.cash_balance -= cost
+        elif sell_button and holding is not None and holding['Quantity'] >= quantity:
+            holding['Total_Invested'] -= holding['Total_Invested'] * quantity / holding['Quantity']
+            holding['Quantity'] -= quantity
+            if holding['Quantity'] == 0:
+                st.session_state.portfolio.pop(selected_stock)
+            st.session_state.cash_balance += cost
+        else:
+            st.error('Transaction could not be completed due to insufficient funds or stocks.')
+            return
+
+        # Record transaction and performance with one shared timestamp
+        now = datetime.datetime.now()
+        history = st.session_state.transaction_history
+        history['Date'].append(now)
+        history['Stock'].append(selected_stock)
+        history['Type'].append(transaction_type)
+        history['Quantity'].append(quantity)
+        history['Price'].append(current_price)
+        history['Total'].append(cost)
+
+        # Record performance; trading at the current price does not change total value,
+        # so no revaluation fetch is needed here
+        append_performance(now, st.session_state.total_value)
+
+        # Invalidate only the traded ticker's cached price so the next render refetches it
+        fetch_stock_price.clear(selected_stock)
+        rebuild_portfolio_df()
+        persist_session_state()
+        st.success(f'{transaction_type} {quantity} shares of {selected_stock} at ${current_price:.2f} each.')
+
+@st.fragment
+def render_analytics():
+    import plotly.graph_objects as go
+    st.subheader('Advanced Analytics')
+
+    st.write("### Risk Metrics")
+    risk_metrics_df, sp500_returns = fetch_risk_metrics(tuple(available_stocks))
+    st.dataframe(risk_metrics_df, use_container_width=True)
+
+    # Comparison with S&P 500
+    st.write("### Performance Comparison with S&P 500")
+    if st.session_state.performance_count:
+        portfolio_values = pd.Series(performance_view()['Total Value'])
+        portfolio_returns = portfolio_values.pct_change().dropna()
+
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=portfolio_returns.index, y=portfolio_returns, mode='lines', name='Portfolio Returns'))
+        fig.add_trace(go.Scatter(x=sp500_returns.index, y=sp500_returns, mode='lines', name='S&P 500 Returns'))
+        fig.update_layout(title='Portfolio vs S&P 500 Returns', xaxis_title='Date', yaxis_title='Returns')
+        st.plotly_chart(fig)
+
+@st.fragment
+def render_watchlist():
+    st.subheader('Watchlist')
+
+    # Add stocks to watchlist
+    add_stock = st.selectbox('Add stock to watchlist:', available_stocks)
+    if st.button('Add to Watchlist'):
+        if add_stock not in st.session_state.watchlist:
+            st.session_state.watchlist.append(add_stock)
+            persist_session_state()
+            st.success(f'{add_stock} added to watchlist.')
+        else:
+            st.warning(f'{add_stock} is already in the watchlist.')
+
+    # Display watchlist
+    if st.session_state.watchlist:
+        st.write('### Your Watchlist')
+        # One batched price fetch and a single dataframe render for the whole list
+        watchlist_prices = fetch_stock_prices_batch(tuple(st.session_state.watchlist))
+        watchlist_df = pd.DataFrame({'Stock': st.session_state.watchlist,
+                                     'Price': [watchlist_prices.get(stock, float('nan')) for stock in st.session_state.watchlist]})
+        st.dataframe(watchlist_df, use_container_width=True, hide_index=True)
+
+        # Select stock from watchlist to display candlestick chart
+        watchlist_stock = st.selectbox('Select a stock from watchlist to view chart:', st.session_state.watchlist)
+        if watchlist_stock:
+            weekly = st.toggle('Weekly candles', value=True)
+            stock_history = fetch_stock_history(watchlist_stock, period='1mo')
+            if weekly:
+                stock_history = to_weekly(stock_history)
+            fig = build_candlestick_fig(watchlist_stock, (len(stock_history), stock_history.index[-1].value, weekly), stock_history)
+            st.plotly_chart(fig)
+
+        # Option to remove stock from watchlist
+        remove_stock = st.selectbox('Remove stock from watchlist:', st.session_state.watchlist)
+        if st.button('Remove from Watchlist'):
+            st.session_state.watchlist.remove(remove_stock)
+            persist_session_state()
+            st.success(f'{remove_stock} removed from watchlist.')
+
+@st.fragment
+def render_load_money():
+    st.subheader('Load Money')
+    st.write('scan QR using any payment aggregator || copy your transaction id and enter below')
+    st.image('QR.jpg', caption='Scan this QR code for payment', width=200)
+    st.write('Enter your transaction ID to proceed with loading money.')
+    st.write('Trouble loading money ? click link to contact us : https://tradelitcare.streamlit.app ')
+    st.markdown("<marquee style='color: red;'>Caution: Enter transaction ID only after payment. If we don't find a matching ID, REFUND will not be executed.</marquee>", unsafe_allow_html=True)
+    random_number = st.text_input('Transaction ID:')
+    if len(random_number) >= 8:
+        amount_to_load = st.number_input('Enter amount to load (20-50):', min_value=20, max_value=50)
+        if st.button('Load Money'):
+            st.session_state.cash_balance += amount_to_load * amount_to_load
+            st.session_state.total_value += amount_to_load * amount_to_load
+            persist_session_state()
+            st.success(f'${amount_to_load * amount_to_load} loaded to your account.')
+
+def render_info():
+    st.subheader('Information')
+    st.write('this simulator just shows the working of trading platform , where beginners can get started')
+    st.write('there are tabs/options to choose but follow these steps for clear vision')
+    st.write('step 1 : go to trade and buy some stock')
+    st.write('step 2 : check out portfolio for holding info')
+    st.write('step 3 : checkout transactions for transacted details ')
+    st.write('info: you can know more about stock in left top bar button , add correct stock keyword  ')
+    st.write('info :  you can put some stocks for watclist in watchlist tab')
+    st.write('info : if you run out of money , visit load money tab ')
+    st.write('great! now youre good to go , try out more  ')
+    st.write('Thankyou')
+    st.write(" click link to contact us : https://tradelitcare.streamlit.app ")
 
 def main():
     st.title('Advanced Paper Trading Simulator')
@@ -57,7 +498,12 @@ def main():
     st.sidebar.header('Stock Search')
     search_stock = st.sidebar.text_input('Enter stock ticker (e.g., AAPL):', value='AAPL')
     if search_stock:
-        stock_info = fetch_stock_details(search_stock)
+        # Fetch only when the searched ticker actually changes; interactions elsewhere
+        # in the app reuse the panel stored in session state even after the cache TTL
+        if search_stock != st.session_state.get('_last_search'):
+            st.session_state['_sidebar_panel'] = fetch_sidebar_panel(search_stock)
+            st.session_state['_last_search'] = search_stock
+        stock_info, stock_history = st.session_state['_sidebar_panel']
         st.sidebar.write(f"**{stock_info['shortName']} ({search_stock})**")
         st.sidebar.write(f"**Current Price:** ${stock_info['currentPrice']:.2f}")
         st.sidebar.write(f"**Market Cap:** ${stock_info['marketCap']:,}")
@@ -68,200 +514,28 @@ def main():
         st.sidebar.write(f"**Description:** {stock_info['longBusinessSummary']}")
 
         # Historical Stock Price Chart in Sidebar
-        stock_history = fetch_stock_history(search_stock, period='6mo')
-        stock_history['RSI'] = calculate_rsi(stock_history['Close'])
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=stock_history.index, y=stock_history['Close'], mode='lines', name='Close Price'))
-        fig.add_trace(go.Scatter(x=stock_history.index, y=stock_history['RSI'], mode='lines', name='RSI'))
-        fig.update_layout(title=f'{search_stock} Price and RSI', xaxis_title='Date', yaxis_title='Price/RSI')
+        fig = build_sidebar_fig(search_stock, (len(stock_history), stock_history.index[-1].value), stock_history)
         st.sidebar.plotly_chart(fig)
 
     # Tabs for different sections
     tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs(['Portfolio', 'Transaction History', 'Performance', 'Trade', 'Analytics', 'Watchlist', 'Load Money', 'info'])
 
     with tab1:
-        st.subheader('Your Virtual Portfolio')
-        st.write(f'Cash balance: ${st.session_state.cash_balance:.2f}')
-        portfolio_df = pd.DataFrame(list(st.session_state.portfolio.items()), columns=['Stock', 'Shares'])
-        portfolio_df['Current Price'] = portfolio_df['Stock'].apply(fetch_stock_price)
-        portfolio_df['Total Value'] = portfolio_df['Shares'] * portfolio_df['Current Price']
-        st.table(portfolio_df)
-
-        # Pie chart of portfolio distribution
-        fig = px.pie(portfolio_df, values='Total Value', names='Stock', title='Portfolio Distribution')
-        st.plotly_chart(fig)
-
+        render_portfolio()
     with tab2:
-        st.subheader('Transaction History')
-        if st.session_state.transaction_history:
-            history_df = pd.DataFrame(st.session_state.transaction_history)
-            st.table(history_df)
-
-            # Plot transaction history
-            fig = px.line(history_df, x='Date', y='Total', color='Type', title='Transaction History Over Time')
-            st.plotly_chart(fig)
-
+        render_transaction_history()
     with tab3:
-        st.subheader('Portfolio Performance')
-        if st.session_state.performance:
-            performance_df = pd.DataFrame(st.session_state.performance)
-            fig = px.line(performance_df, x='Date', y='Total Value', title='Portfolio Performance Over Time')
-            st.plotly_chart(fig)
-
-        # Advanced Portfolio Analytics
-        st.subheader('Portfolio Analytics')
-        portfolio_value = sum(st.session_state.portfolio[stock] * fetch_stock_price(stock) for stock in available_stocks)
-        total_value = portfolio_value + st.session_state.cash_balance
-        st.write(f'Total portfolio value: ${total_value:.2f}')
-
-        diversification = {stock: (st.session_state.portfolio[stock] * fetch_stock_price(stock)) / total_value for stock in available_stocks}
-        diversification_df = pd.DataFrame(list(diversification.items()), columns=['Stock', 'Proportion'])
-        fig = px.bar(diversification_df, x='Stock', y='Proportion', title='Portfolio Diversification')
-        st.plotly_chart(fig)
-
+        render_performance()
     with tab4:
-        st.subheader('Trade Stocks')
-        # Display available stocks
-        selected_stock = st.selectbox('Select a stock:', available_stocks)
-        
-        # Get real-time price of the selected stock
-        current_price = fetch_stock_price(selected_stock)
-        st.write(f'Current price of {selected_stock}: ${current_price:.2f}')
-
-        # Get user input for quantity of stocks to buy/sell
-        quantity = st.number_input('Enter quantity:', min_value=1, step=1)
-
-        # Buttons for buying and selling
-        buy_button = st.button('Buy')
-        sell_button = st.button('Sell')
-
-        # Simulate buying/selling stocks
-        if buy_button or sell_button:
-            transaction_type = 'Buy' if buy_button else 'Sell'
-            cost = quantity * current_price
-            
-            if buy_button and st.session_state.cash_balance >= cost:
-                st.session_state.portfolio[selected_stock] += quantity
-                st.session_state.cash_balance -= cost
-            elif sell_button and st.session_state.portfolio[selected_stock] >= quantity:
-                st.session_state.portfolio[selected_stock] -= quantity
-                st.session_state.cash_balance += cost
-            else:
-                st.error('Transaction could not be completed due to insufficient funds or stocks.')
-                return
-
-            # Record transaction
-            st.session_state.transaction_history.append({
-                'Date': datetime.datetime.now(),
-                'Stock': selected_stock,
-                'Type': transaction_type,
-                'Quantity': quantity,
-                'Price': current_price,
-                'Total': cost
-            })
-
-            # Record performance
-            total_value = sum(st.session_state.portfolio[stock] * fetch_stock_price(stock) for stock in available_stocks) + st.session_state.cash_balance
-            st.session_state.performance.append({
-                'Date': datetime.datetime.now(),
-                'Total Value': total_value
-            })
-
-            st.success(f'{transaction_type} {quantity} shares of {selected_stock} at ${current_price:.2f} each.')
-
+        render_trade()
     with tab5:
-        st.subheader('Advanced Analytics')
-        
-        st.write("### Risk Metrics")
-        risk_metrics = {}
-        for stock in available_stocks:
-            stock_data = fetch_stock_history(stock, period='1y')
-            returns = stock_data['Close'].pct_change().dropna()
-            risk_metrics[stock] = {
-                'Standard Deviation': returns.std(),
-                'Beta': np.cov(returns, returns)[0, 1] / np.var(returns)
-            }
-
-        risk_metrics_df = pd.DataFrame(risk_metrics).T
-        st.table(risk_metrics_df)
-
-        # Comparison with S&P 500
-        st.write("### Performance Comparison with S&P 500")
-        sp500 = yf.Ticker("^GSPC").history(period='1y')
-        sp500['Returns'] = sp500['Close'].pct_change().dropna()
-        
-        if st.session_state.performance:
-            portfolio_values = pd.Series([perf['Total Value'] for perf in st.session_state.performance])
-            portfolio_returns = portfolio_values.pct_change().dropna()
-
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(x=portfolio_returns.index, y=portfolio_returns, mode='lines', name='Portfolio Returns'))
-            fig.add_trace(go.Scatter(x=sp500['Returns'].index, y=sp500['Returns'], mode='lines', name='S&P 500 Returns'))
-            fig.update_layout(title='Portfolio vs S&P 500 Returns', xaxis_title='Date', yaxis_title='Returns')
-            st.plotly_chart(fig)
-
+        render_analytics()
     with tab6:
-        st.subheader('Watchlist')
-        
-        # Add stocks to watchlist
-        add_stock = st.selectbox('Add stock to watchlist:', available_stocks)
-        if st.button('Add to Watchlist'):
-            if add_stock not in st.session_state.watchlist:
-                st.session_state.watchlist.append(add_stock)
-                st.success(f'{add_stock} added to watchlist.')
-            else:
-                st.warning(f'{add_stock} is already in the watchlist.')
-
-        # Display watchlist
-        if st.session_state.watchlist:
-            st.write('### Your Watchlist')
-            watchlist_df = pd.DataFrame(st.session_state.watchlist, columns=['Stock'])
-            st.table(watchlist_df)
-
-            # Select stock from watchlist to display candlestick chart
-            watchlist_stock = st.selectbox('Select a stock from watchlist to view chart:', st.session_state.watchlist)
-            if watchlist_stock:
-                stock_history = fetch_stock_history(watchlist_stock, period='1mo')
-                fig = go.Figure(data=[go.Candlestick(x=stock_history.index,
-                                                     open=stock_history['Open'],
-                                                     high=stock_history['High'],
-                                                     low=stock_history['Low'],
-                                                     close=stock_history['Close'])])
-                fig.update_layout(title=f'Candlestick Chart for {watchlist_stock}', xaxis_title='Date', yaxis_title='Price')
-                st.plotly_chart(fig)
-
-            # Option to remove stock from watchlist
-            remove_stock = st.selectbox('Remove stock from watchlist:', st.session_state.watchlist)
-            if st.button('Remove from Watchlist'):
-                st.session_state.watchlist.remove(remove_stock)
-                st.success(f'{remove_stock} removed from watchlist.')
-
+        render_watchlist()
     with tab7:
-        st.subheader('Load Money')
-        st.write('scan QR using any payment aggregator || copy your transaction id and enter below')
-        st.image('QR.jpg', caption='Scan this QR code for payment', width=200)
-        st.write('Enter your transaction ID to proceed with loading money.')
-        st.write('Trouble loading money ? click link to contact us : https://tradelitcare.streamlit.app ') 
-        st.markdown("<marquee style='color: red;'>Caution: Enter transaction ID only after payment. If we don't find a matching ID, REFUND will not be executed.</marquee>", unsafe_allow_html=True)
-        random_number = st.text_input('Transaction ID:')
-        if len(random_number) >= 8:
-            amount_to_load = st.number_input('Enter amount to load (20-50):', min_value=20, max_value=50)
-            if st.button('Load Money'):
-                st.session_state.cash_balance += amount_to_load * amount_to_load
-                st.success(f'${amount_to_load * amount_to_load} loaded to your account.')
+        render_load_money()
     with tab8:
-        st.subheader('Information')
-        st.write('this simulator just shows the working of trading platform , where beginners can get started')
-        st.write('there are tabs/options to choose but follow these steps for clear vision')
-        st.write('step 1 : go to trade and buy some stock')
-        st.write('step 2 : check out portfolio for holding info')
-        st.write('step 3 : checkout transactions for transacted details ')
-        st.write('info: you can know more about stock in left top bar button , add correct stock keyword  ')
-        st.write('info :  you can put some stocks for watclist in watchlist tab')
-        st.write('info : if you run out of money , visit load money tab ')
-        st.write('great! now youre good to go , try out more  ')
-        st.write('Thankyou')
-        st.write(" click link to contact us : https://tradelitcare.streamlit.app ")
-  
+        render_info()
+
 if __name__ == '__main__':
     main()